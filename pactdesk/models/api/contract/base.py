@@ -7,7 +7,7 @@ contract types.
 
 from typing import TypeVar
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from pactdesk.models.domain.party import LegalEntity, NaturalPerson, Party
 
@@ -41,11 +41,27 @@ class BaseContractRequest(BaseModel):
             proceedings related to the contract must be conducted.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     contract_type: str
     parties: dict[str, Party]
     applicable_law: str
     place_of_jurisdiction: str
 
+    def __hash__(self) -> int:
+        """Compute a hash from the serialized request.
+
+        The default frozen-model hash cannot be used because the parties
+        field is a dict, which is unhashable. Hashing the canonical JSON
+        serialization instead gives a stable value that matches equality,
+        allowing requests to be used as cache keys.
+
+        Returns
+        -------
+            int: The hash of the serialized request.
+        """
+        return hash(self.model_dump_json())
+
     @classmethod
     @field_validator("parties")  # type: ignore[misc]
     def validate_parties(
@@ -5,6 +5,7 @@ It includes classes for text elements, paragraphs, clauses, sections, and signat
 support for template-based rendering using Jinja2.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -23,14 +24,14 @@ class BaseText(BaseModel):
 
     content: str = Field(..., description="The text content of the element")
 
-    def render(self, context: dict[str, Any] | None = None) -> str:
+    def render(self, context: Mapping[str, Any] | None = None) -> str:
         """Render the text content with the given context.
 
         This method formats the text content using the provided context data,
         replacing placeholders with actual values.
 
         Args:
-            context (dict[str, Any] | None): The context data for rendering.
+            context (Mapping[str, Any] | None): The context data for rendering.
 
         Returns
         -------
@@ -57,14 +58,14 @@ class Paragraph(BaseText):
     heading: str | None = Field(None, description="Optional heading for the paragraph")
     subparagraphs: list[str] | None = Field(None, description="Optional list of subparagraphs")
 
-    def render(self, context: dict[str, Any] | None = None) -> str:
+    def render(self, context: Mapping[str, Any] | None = None) -> str:
         """Render the paragraph with its heading and subparagraphs.
 
         This method formats the paragraph content, including any heading and
         subparagraphs, using the provided context data.
 
         Args:
-            context (dict[str, Any] | None): The context data for rendering.
+            context (Mapping[str, Any] | None): The context data for rendering.
 
         Returns
         -------
@@ -97,14 +98,14 @@ class Clause(BaseText):
     title: str = Field(..., description="The title of the clause")
     paragraphs: list[Paragraph] | None = Field(None, description="Optional list of paragraphs")
 
-    def render(self, context: dict[str, Any] | None = None) -> str:
+    def render(self, context: Mapping[str, Any] | None = None) -> str:
         """Render the clause with its title and paragraphs.
 
         This method formats the clause content, including its title and any
         paragraphs, using the provided context data.
 
         Args:
-            context (dict[str, Any] | None): The context data for rendering.
+            context (Mapping[str, Any] | None): The context data for rendering.
 
         Returns
         -------
@@ -136,14 +137,14 @@ class Section(BaseText):
     )
     closing: BaseText | None = Field(None, description="Optional closing statement")
 
-    def render(self, context: dict[str, Any] | None = None) -> str:
+    def render(self, context: Mapping[str, Any] | None = None) -> str:
         """Render the section with its subsections and closing.
 
         This method formats the section content, including all subsections and
         any closing statement, using the provided context data.
 
         Args:
-            context (dict[str, Any] | None): The context data for rendering.
+            context (Mapping[str, Any] | None): The context data for rendering.
 
         Returns
         -------
@@ -5,10 +5,11 @@ in a contract, including natural persons and legal entities. It includes validat
 logic for addresses and party-specific attributes.
 """
 
+from functools import cached_property
 import re
-from typing import Annotated, Literal, Self, TypeVar
+from typing import Annotated, Literal, TypeVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from pactdesk.models.domain.enum import CompanyType, InformationRole, PartyType
 
@@ -27,6 +28,8 @@ class BaseParty(BaseModel):
         party_type (str): The type of party (natural_person or legal_entity).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     party_type: str
 
 
@@ -43,15 +46,16 @@ class Address(BaseModel):
         city (str): The city name.
         postcode (str): The postal code (validated for Dutch format).
         suffix (str | None): Optional address suffix (e.g., apartment number).
-        _formatted (str | None): The formatted address string.
+        _formatted (str): The formatted address string, computed on first access.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     street_name: str
     house_nr: str
     city: str
     postcode: str
     suffix: str | None = None
-    _formatted: str | None = None
 
     @field_validator("postcode")  # type: ignore[misc]
     @classmethod
@@ -79,19 +83,21 @@ class Address(BaseModel):
 
         return value
 
-    @model_validator(mode="after")  # type: ignore[misc]
-    def format_address(self) -> Self:
+    @cached_property
+    def _formatted(self) -> str:
         """Format the address components into a single string.
 
+        The result is computed once per instance and cached for subsequent
+        accesses.
+
         Returns
         -------
-            Self: The instance with the formatted address.
+            str: The formatted address.
         """
-        self._formatted = f"{self.street_name} {self.house_nr}"
+        formatted = f"{self.street_name} {self.house_nr}"
         if self.suffix:
-            self._formatted += f" {self.suffix}"
-        self._formatted += f", {self.postcode} {self.city}"
-        return self
+            formatted += f" {self.suffix}"
+        return f"{formatted}, {self.postcode} {self.city}"
 
 
 class NaturalPerson(BaseParty):
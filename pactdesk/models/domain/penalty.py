@@ -7,7 +7,7 @@ amounts are positive values.
 
 from typing import TypeVar
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 T = TypeVar("T", bound=BaseModel)
@@ -25,6 +25,8 @@ class Penalty(BaseModel):
         subsequent_amount (int): The amount for any subsequent breaches.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     initial_amount: int
     subsequent_amount: int
 
@@ -7,7 +7,7 @@ term durations are positive values.
 
 from typing import Literal, TypeVar
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 T = TypeVar("T", bound=BaseModel)
@@ -25,6 +25,8 @@ class Term(BaseModel):
         duration_unit (Literal["years", "months"]): The unit of time (years or months).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     duration_amount: int
     duration_unit: Literal["years", "months"]
 
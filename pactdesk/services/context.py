@@ -5,176 +5,333 @@ rendering contract templates. It handles different types of contracts and
 their specific context requirements.
 """
 
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import functools
+from typing import NotRequired, TypedDict
+
 from loguru import logger
-from pydantic import BaseModel
 
 from pactdesk.models.api.contract import ContractRequest
-from pactdesk.models.domain.enum import ContractType, InformationRole, PartyType
+from pactdesk.models.domain.enum import (
+    ContractType,
+    InformationRole,
+    NdaContractVariant,
+    PartyType,
+)
 from pactdesk.models.domain.party import LegalEntity, NaturalPerson
 
 
-class ContextService(BaseModel):
-    """Service for constructing context data for contract templates.
+_PT_LEGAL = PartyType.LEGAL_ENTITY.value
+_PT_NATURAL = PartyType.NATURAL_PERSON.value
+
+_ROLE_DISCLOSING = "the Disclosing Party"
+_ROLE_RECEIVING = "the Receiving Party"
+
 
-    This class provides methods for building the context data needed to render
-    contract templates, including party-specific and contract-type-specific
-    information.
+@dataclass(frozen=True, slots=True)
+class GlobalContext:
+    """Shared context data that applies to the contract as a whole.
+
+    Attributes
+    ----------
+        n_parties (int): The number of parties involved in the contract.
+        contract_variant (str): The contract variant identifier.
     """
 
-    @staticmethod
-    def construct_party_context(request: ContractRequest) -> dict[str, dict[str, str | int | None]]:
-        """Construct the context data for contract parties.
-
-        This method builds a dictionary containing all party-specific information
-        needed for template rendering, including roles and contact details.
-
-        Args:
-            request (ContractRequest): The contract request containing party data.
-
-        Returns
-        -------
-            dict[str, dict[str, str | int | None]]: The constructed party context.
-
-        Raises
-        ------
-            ValueError: If an invalid party type is encountered.
-        """
-        total_parties = len(request.parties)
-        party_context: dict[str, dict[str, str | int | None]] = {
-            "_global": {
-                "n_parties": str(total_parties),
-                "contract_variant": request.contract_variant.value,
-            }
-        }
-
-        for key, party in request.parties.items():
-            if total_parties == 2:
-                role = (
-                    "the Disclosing Party"
-                    if party.information_role == InformationRole.DISCLOSING
-                    else "the Receiving Party"
-                )
-            else:
-                role = party.name if isinstance(party, LegalEntity) else party.full_name
-
-            if isinstance(party, LegalEntity):
-                party_context[key] = {
-                    "type": PartyType.LEGAL_ENTITY.value,
-                    "name": party.name,
-                    "company_type": party.company_type.value,
-                    "country": party.country_of_incorporation,
-                    "address": party.registered_address._formatted,
-                    "kvk_nr": party.kvk_nr,
-                    "representative": party.signatory_name,
-                    "role": role,
-                }
-            elif isinstance(party, NaturalPerson):
-                party_context[key] = {
-                    "type": PartyType.NATURAL_PERSON.value,
-                    "name": party.full_name,
-                    "date_of_birth": party.date_of_birth,
-                    "place_of_birth": party.place_of_birth,
-                    "address": party.address._formatted,
-                    "role": role,
-                }
-
-            else:
-                err_msg = (
-                    f"Party type {party.party_type} is not valid. "
-                    "Must be either `legal_entity` or `natural_person`."
-                )
-                raise ValueError(err_msg)
-
-        return party_context
-
-    @staticmethod
-    def _construct_nondisclosure_context(request: ContractRequest) -> dict[str, str | int | None]:
-        """Construct the context data for non-disclosure agreements.
-
-        This method builds a dictionary containing all NDA-specific information
-        needed for template rendering, including purpose and term details.
-
-        Args:
-            request (ContractRequest): The NDA contract request.
-
-        Returns
-        -------
-            dict[str, str | int | None]: The constructed NDA context.
-        """
-        context: dict[str, str | int | None] = {
-            "city": request.place_of_jurisdiction,
-            "country": request.applicable_law,
-            "purpose": request.contract_purpose,
-        }
-
-        if request.limited_term:
-            context.update(
-                {
-                    "duration_amount": str(request.limited_term.duration_amount),
-                    "duration_unit": request.limited_term.duration_unit,
-                }
-            )
+    n_parties: int
+    contract_variant: str
+
+
+@dataclass(frozen=True, slots=True)
+class LegalEntityContext:
+    """Context data for a legal entity party.
+
+    Attributes
+    ----------
+        type (str): The party type, always `legal_entity`.
+        name (str): The legal name of the entity.
+        company_type (str): The type of legal entity.
+        country (str): The country of incorporation.
+        address (str | None): The formatted registered address.
+        kvk_nr (str): The Chamber of Commerce registration number.
+        representative (str): The name of the authorized signatory.
+        role (str): The party's role in the contract.
+    """
+
+    type: str
+    name: str
+    company_type: str
+    country: str
+    address: str | None
+    kvk_nr: str
+    representative: str
+    role: str
+
+
+@dataclass(frozen=True, slots=True)
+class NaturalPersonContext:
+    """Context data for a natural person party.
+
+    Attributes
+    ----------
+        type (str): The party type, always `natural_person`.
+        name (str): The complete name of the person.
+        date_of_birth (str): The person's date of birth.
+        place_of_birth (str): The person's place of birth.
+        address (str | None): The formatted address.
+        role (str): The party's role in the contract.
+    """
+
+    type: str
+    name: str
+    date_of_birth: str
+    place_of_birth: str
+    address: str | None
+    role: str
+
+
+PartyContext = GlobalContext | LegalEntityContext | NaturalPersonContext
+
+
+class NdaContext(TypedDict):
+    """Statically-typed shape of the nondisclosure agreement context.
+
+    The optional keys are only present when the request carries the matching
+    clause. TypedDict is erased at runtime, so this costs nothing while
+    giving type checkers (and ahead-of-time compilers) the exact field
+    layout.
+    """
+
+    city: str
+    country: str
+    purpose: str
+    duration_amount: NotRequired[int]
+    duration_unit: NotRequired[str]
+    initial_amount: NotRequired[int]
+    subsequent_amount: NotRequired[int]
+
+
+ContractContext = NdaContext | dict[str, str | int | None]
+
+
+def _build_legal_entity_context(party: LegalEntity, role: str) -> LegalEntityContext:
+    """Build the rendering context for a legal entity party."""
+    return LegalEntityContext(
+        type=_PT_LEGAL,
+        name=party.name,
+        company_type=party.company_type.value,
+        country=party.country_of_incorporation,
+        address=party.registered_address._formatted,
+        kvk_nr=party.kvk_nr,
+        representative=party.signatory_name,
+        role=role,
+    )
+
+
+def _build_natural_person_context(party: NaturalPerson, role: str) -> NaturalPersonContext:
+    """Build the rendering context for a natural person party."""
+    return NaturalPersonContext(
+        type=_PT_NATURAL,
+        name=party.full_name,
+        date_of_birth=party.date_of_birth,
+        place_of_birth=party.place_of_birth,
+        address=party.address._formatted,
+        role=role,
+    )
+
+
+_PARTY_BUILDERS: dict[type, Callable[..., PartyContext]] = {
+    LegalEntity: _build_legal_entity_context,
+    NaturalPerson: _build_natural_person_context,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _global_context(total_parties: int, contract_variant: NdaContractVariant) -> GlobalContext:
+    """Return the shared global context for a party count and contract variant.
+
+    GlobalContext is frozen, so the memoized instance can safely be shared
+    across requests with the same party count and variant.
+    """
+    return GlobalContext(
+        n_parties=total_parties,
+        contract_variant=contract_variant.value,
+    )
+
+
+def construct_party_context(request: ContractRequest) -> dict[str, PartyContext]:
+    """Construct the context data for contract parties.
 
-        if request.penalty_clause:
-            context.update(
-                {
-                    "initial_amount": str(request.penalty_clause.initial_amount),
-                    "subsequent_amount": str(request.penalty_clause.subsequent_amount),
-                }
+    This function builds a dictionary containing all party-specific information
+    needed for template rendering, including roles and contact details.
+
+    Args:
+        request (ContractRequest): The contract request containing party data.
+
+    Returns
+    -------
+        dict[str, PartyContext]: The constructed party context.
+
+    Raises
+    ------
+        ValueError: If an invalid party type is encountered.
+    """
+    total_parties = len(request.parties)
+    two_party = total_parties == 2
+    entries: list[tuple[str, PartyContext]] = []
+
+    for key, party in request.parties.items():
+        if two_party:
+            # Mutual (and unset) roles render as receiving, matching the
+            # historical treatment of every non-disclosing party.
+            role = (
+                _ROLE_DISCLOSING
+                if party.information_role is InformationRole.DISCLOSING
+                else _ROLE_RECEIVING
             )
+        else:
+            role = party.name if isinstance(party, LegalEntity) else party.full_name
+
+        try:
+            builder = _PARTY_BUILDERS[type(party)]
+        except KeyError:
+            err_msg = (
+                f"Party type {party.party_type} is not valid. "
+                "Must be either `legal_entity` or `natural_person`."
+            )
+            raise ValueError(err_msg) from None
+
+        entries.append((key, builder(party, role)))
+
+    party_context: dict[str, PartyContext] = {
+        "_global": _global_context(total_parties, request.contract_variant)
+    }
+    party_context.update(entries)
+    return party_context
+
+
+def _construct_nondisclosure_context(request: ContractRequest) -> NdaContext:
+    """Construct the context data for non-disclosure agreements.
+
+    This function builds a dictionary containing all NDA-specific information
+    needed for template rendering, including purpose and term details.
+
+    Args:
+        request (ContractRequest): The NDA contract request.
+
+    Returns
+    -------
+        NdaContext: The constructed NDA context.
+    """
+    context: NdaContext = {
+        "city": request.place_of_jurisdiction,
+        "country": request.applicable_law,
+        "purpose": request.contract_purpose,
+    }
+
+    if (limited_term := request.limited_term) is not None:
+        context["duration_amount"] = limited_term.duration_amount
+        context["duration_unit"] = limited_term.duration_unit
+
+    if (penalty_clause := request.penalty_clause) is not None:
+        context["initial_amount"] = penalty_clause.initial_amount
+        context["subsequent_amount"] = penalty_clause.subsequent_amount
+
+    return context
 
-        return context
 
-    @staticmethod
-    def _construct_shareholder_context(request: ContractRequest) -> dict[str, str | int | None]:
-        """Construct the context data for shareholder agreements.
+def _construct_shareholder_context(request: ContractRequest) -> dict[str, str | int | None]:
+    """Construct the context data for shareholder agreements.
 
-        Args:
-            request (ContractRequest): The shareholder agreement request.
+    Args:
+        request (ContractRequest): The shareholder agreement request.
+
+    Returns
+    -------
+        dict[str, str | int | None]: The constructed shareholder context.
+    """
+    logger.debug("Constructing shareholder's agreement context.")
+    return {}
 
-        Returns
-        -------
-            dict[str, str | int | None]: The constructed shareholder context.
-        """
-        return {}
 
-    @staticmethod
-    def _construct_management_context(request: ContractRequest) -> dict[str, str | int | None]:
-        """Construct the context data for management agreements.
+def _construct_management_context(request: ContractRequest) -> dict[str, str | int | None]:
+    """Construct the context data for management agreements.
 
-        Args:
-            request (ContractRequest): The management agreement request.
+    Args:
+        request (ContractRequest): The management agreement request.
 
-        Returns
-        -------
-            dict[str, str | int | None]: The constructed management context.
-        """
-        return {}
+    Returns
+    -------
+        dict[str, str | int | None]: The constructed management context.
+    """
+    logger.debug("Constructing management agreement context.")
+    return {}
 
-    @staticmethod
-    def construct_context(request: ContractRequest) -> dict[str, str | int | None] | None:
-        """Construct the appropriate context based on contract type.
 
-        This method routes the context construction to the appropriate handler
-        based on the contract type specified in the request.
+_CONTEXT_DISPATCH: dict[ContractType, Callable[[ContractRequest], ContractContext]] = {
+    ContractType.NONDISCLOSURE: _construct_nondisclosure_context,
+    ContractType.SHAREHOLDERS: _construct_shareholder_context,
+    ContractType.MANAGEMENT: _construct_management_context,
+}
 
-        Args:
-            request (ContractRequest): The contract request.
 
-        Returns
-        -------
-            dict[str, str | int | None] | None: The constructed context or None if
-                the contract type is not supported.
-        """
-        if request.contract_type == ContractType.NONDISCLOSURE:
-            return ContextService._construct_nondisclosure_context(request)
+@functools.lru_cache(maxsize=256)
+def construct_context(request: ContractRequest) -> ContractContext | None:
+    """Construct the appropriate context based on contract type.
 
-        if request.contract_type == ContractType.SHAREHOLDERS:
-            logger.debug("Constructing shareholder's agreement context.")
-            return ContextService._construct_shareholder_context(request)
+    This function routes the context construction to the appropriate handler
+    based on the contract type specified in the request. Results are
+    memoized per request, so regenerating a contract from an identical
+    request reuses the previously built context.
 
-        if request.contract_type == ContractType.MANAGEMENT:
-            logger.debug("Constructing management agreement context.")
-            return ContextService._construct_management_context(request)
+    Args:
+        request (ContractRequest): The contract request.
 
+    Returns
+    -------
+        ContractContext | None: The constructed context or None if the
+            contract type is not supported.
+    """
+    handler = _CONTEXT_DISPATCH.get(request.contract_type)
+    if handler is None:
+        logger.warning("Unsupported contract type: {}", request.contract_type)
         return None
+
+    return handler(request)
+
+
+def construct_contexts(
+    requests: Iterable[ContractRequest],
+) -> list[ContractContext | None]:
+    """Construct contexts for a batch of contract requests.
+
+    This function applies the contract-type dispatch to every request in a
+    single comprehension, with the dispatch table bound to a local so batch
+    workflows avoid per-call global lookups.
+
+    Args:
+        requests (Iterable[ContractRequest]): The contract requests.
+
+    Returns
+    -------
+        list[ContractContext | None]: One context per request, or None for
+            unsupported contract types.
+    """
+    dispatch_get = _CONTEXT_DISPATCH.get
+    return [
+        handler(request) if (handler := dispatch_get(request.contract_type)) is not None else None
+        for request in requests
+    ]
+
+
+class ContextService:
+    """Service facade for constructing context data for contract templates.
+
+    The implementations live as module-level functions so hot callers avoid
+    descriptor dispatch; this class re-exports them for API stability.
+    """
+
+    construct_party_context = staticmethod(construct_party_context)
+    construct_context = staticmethod(construct_context)
+    construct_contexts = staticmethod(construct_contexts)
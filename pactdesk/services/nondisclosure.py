@@ -5,16 +5,107 @@ templates and request data. It handles the construction of all sections of an ND
 including parties, considerations, agreements, and signatures.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+import os
 from pathlib import Path
+from typing import ClassVar
 
 from loguru import logger
 
 from pactdesk.models.api.contract.nondisclosure import NondisclosureRequest
 from pactdesk.models.domain.base import BaseText, Clause, Paragraph, Section
 from pactdesk.models.domain.contract import Contract
-from pactdesk.models.domain.enum import PartyType
-from pactdesk.services.context import ContextService
-from pactdesk.services.template import TemplateService
+from pactdesk.models.domain.enum import NdaContractVariant
+from pactdesk.services.context import ContextService, LegalEntityContext
+from pactdesk.services.template import TemplateService, register_dependent_cache
+
+
+_PARAGRAPH_KEYS = frozenset(("heading", "subparagraphs"))
+
+_SECTION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pactdesk-sections")
+
+_STANDARD_CLAUSES: tuple[str, ...] = (
+    "definitions",
+    "nonuse_and_nondisclosure",
+    "use_and_treatment_of",
+    "data_privacy",
+    "rights_to",
+    "return_or_destruction_of",
+    "third_party_stipulation",
+    "no_warranty",
+    "information_receiving_party",
+    "miscellaneous",
+)
+
+# The receiving-party clause only exists for unilateral NDAs, where exactly
+# one party discloses; mutual variants pre-bake a plan without it.
+_VARIANT_CLAUSE_PLAN: dict[NdaContractVariant, tuple[str, ...]] = {
+    variant: (
+        _STANDARD_CLAUSES
+        if variant.value.startswith("unilateral")
+        else tuple(name for name in _STANDARD_CLAUSES if name != "information_receiving_party")
+    )
+    for variant in NdaContractVariant
+}
+
+_VARIANT_CLAUSE_FILES: dict[NdaContractVariant, tuple[str, ...]] = {
+    variant: tuple(f"{name}.json" for name in plan)
+    for variant, plan in _VARIANT_CLAUSE_PLAN.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _validated_section(path: str) -> Section:
+    """Return the validated Section model for a section template path.
+
+    Validation runs once per path — template files are immutable
+    in-process — so malformed section templates still fail fast at first
+    use while repeat constructions skip re-validation. The cached
+    instance is shared; callers that attach state must copy it first.
+
+    Args:
+        path (str): The path to the section template file.
+
+    Returns
+    -------
+        Section: The validated section model.
+    """
+    return Section(**TemplateService().load(path))
+
+
+register_dependent_cache(_validated_section.cache_clear)
+
+
+@lru_cache(maxsize=64)
+def _resolve_paths(
+    base_path: Path, contract_type: str, contract_variant: str
+) -> tuple[str, str, str, str, str]:
+    """Resolve the template paths for a contract type and variant.
+
+    Path composition and the variant split are invariant per
+    (base path, contract type, variant), so the immutable results are
+    cached and shared across service instances. Paths are returned as
+    plain strings so hot call sites can join with os.path.join instead
+    of allocating PurePath objects.
+
+    Args:
+        base_path (Path): The base directory for template files.
+        contract_type (str): The contract type value.
+        contract_variant (str): The contract variant value, e.g.
+            `unilateral/standard`.
+
+    Returns
+    -------
+        tuple[str, str, str, str, str]: The general, contract and variant
+            template paths, followed by the variant and parties components.
+    """
+    variant, parties = contract_variant.split("/")
+    base = os.fspath(base_path)
+    general_path = os.path.join(base, "general")
+    contract_path = os.path.join(base, contract_type)
+    variant_path = os.path.join(contract_path, variant, parties)
+    return general_path, contract_path, variant_path, variant, parties
 
 
 class NondisclosureService:
@@ -30,16 +121,35 @@ class NondisclosureService:
         variant (str): The NDA variant (unilateral or mutual).
         parties (str): The parties configuration (standard or multi).
         base_path (Path): The base directory for template files.
-        context_service (ContextService): Service for constructing context data.
         template_service (TemplateService): Service for loading templates.
-        context (dict[str, str | int | None] | None): The general context data.
-        party_context (dict[str, dict[str, str | int | None]]): The party context data.
-        general_path (Path): Path to general templates.
-        contract_path (Path): Path to contract-specific templates.
-        variant_path (Path): Path to variant-specific templates.
-        standard_clauses (list[str]): List of standard clause names.
+        context (ContractContext | None): The general context data.
+        party_context (dict[str, PartyContext]): The party context data.
+        general_path (str): Path to general templates.
+        contract_path (str): Path to contract-specific templates.
+        variant_path (str): Path to variant-specific templates.
+        standard_clauses (tuple[str, ...]): The clause plan for the requested variant.
     """
 
+    STANDARD_CLAUSES: ClassVar[tuple[str, ...]] = _STANDARD_CLAUSES
+
+    # Valid for every variant plan: the only clause the mutual plans drop
+    # (information_receiving_party) is ordered after no_warranty.
+    _NO_WARRANTY_INDEX: ClassVar[int] = _STANDARD_CLAUSES.index("no_warranty")
+
+    __slots__ = (
+        "request",
+        "base_path",
+        "general_path",
+        "contract_path",
+        "variant_path",
+        "variant",
+        "parties",
+        "template_service",
+        "context",
+        "party_context",
+        "standard_clauses",
+    )
+
     def __init__(
         self,
         request: NondisclosureRequest,
@@ -52,31 +162,21 @@ class NondisclosureService:
             base_path (Path): The base directory for template files.
         """
         self.request = request
-        self.variant, self.parties = request.contract_variant.split("/")
         self.base_path = base_path
+        (
+            self.general_path,
+            self.contract_path,
+            self.variant_path,
+            self.variant,
+            self.parties,
+        ) = _resolve_paths(base_path, request.contract_type.value, request.contract_variant.value)
 
-        self.context_service = ContextService()
         self.template_service = TemplateService(base_path=base_path)
 
-        self.context = self.context_service.construct_context(request)
-        self.party_context = self.context_service.construct_party_context(request)
-
-        self.general_path = base_path / "general"
-        self.contract_path = base_path / request.contract_type.value
-        self.variant_path = self.contract_path / self.variant / self.parties
-
-        self.standard_clauses: list[str] = [
-            "definitions",
-            "nonuse_and_nondisclosure",
-            "use_and_treatment_of",
-            "data_privacy",
-            "rights_to",
-            "return_or_destruction_of",
-            "third_party_stipulation",
-            "no_warranty",
-            "information_receiving_party",
-            "miscellaneous",
-        ]
+        self.context = ContextService.construct_context(request)
+        self.party_context = ContextService.construct_party_context(request)
+
+        self.standard_clauses: tuple[str, ...] = _VARIANT_CLAUSE_PLAN[request.contract_variant]
 
     def _create_section(
         self, section_name: str, subsections: list[BaseText | Paragraph | Clause]
@@ -91,12 +191,11 @@ class NondisclosureService:
         -------
             Section: The created section.
         """
-        section_template = self.template_service.load(
-            self.general_path / "sections" / f"{section_name}.json"
+        base = _validated_section(
+            os.path.join(self.general_path, "sections", f"{section_name}.json")
         )
         typed_subsections: list[BaseText | Paragraph | Clause] = list(subsections)
-        section_template["subsections"] = typed_subsections
-        return Section(**section_template)
+        return base.model_copy(update={"subsections": typed_subsections})
 
     def _generate_parties(self) -> Section:
         """Generate the parties section of the NDA.
@@ -108,23 +207,21 @@ class NondisclosureService:
         -------
             Section: The generated parties section.
         """
-        party_context = self.context_service.construct_party_context(self.request)
-
-        party_keys = [key for key in party_context if key != "_global"]
+        legal_entity_template = self.template_service.load_legal_entity()
+        natural_person_template = self.template_service.load_natural_person()
         subsections: list[BaseText] = [
-            self.template_service.load_legal_entity()
-            if party_context[party]["type"] == PartyType.LEGAL_ENTITY.value
-            else self.template_service.load_natural_person()
-            for party in party_keys
+            legal_entity_template
+            if isinstance(context, LegalEntityContext)
+            else natural_person_template
+            for key, context in self.party_context.items()
+            if key != "_global"
         ]
 
         section = self._create_section("parties", subsections)
         closing_template = self.template_service.load(
-            self.variant_path / "parties" / "closing.json"
-        )
-        section.closing = (
-            BaseText(**closing_template) if isinstance(closing_template, dict) else closing_template
+            os.path.join(self.variant_path, "parties", "closing.json")
         )
+        section.closing = BaseText(**closing_template)
 
         return section
 
@@ -139,20 +236,23 @@ class NondisclosureService:
             Section: The generated considerations section.
         """
         considerations_data = self.template_service.load(
-            self.variant_path / "considerations" / "considerations.json"
+            os.path.join(self.variant_path, "considerations", "considerations.json")
         )
 
-        paragraphs: list[BaseText | Paragraph] = []
-        if "paragraphs" in considerations_data:
-            for paragraph in considerations_data["paragraphs"]:
-                if isinstance(paragraph, dict):
-                    if "heading" in paragraph or "subparagraphs" in paragraph:
-                        paragraphs.append(Paragraph(**paragraph))
-                    else:
-                        paragraphs.append(BaseText(**paragraph))
+        raw_paragraphs = considerations_data.get("paragraphs")
+        if not raw_paragraphs:
+            return self._create_section("considerations", [])
 
+        paragraphs: list[BaseText | Paragraph] = []
+        for paragraph in raw_paragraphs:
+            if isinstance(paragraph, dict):
+                if _PARAGRAPH_KEYS & paragraph.keys():
+                    paragraphs.append(Paragraph(**paragraph))
                 else:
-                    paragraphs.append(BaseText(content=str(paragraph)))
+                    paragraphs.append(BaseText(**paragraph))
+
+            else:
+                paragraphs.append(BaseText(content=str(paragraph)))
 
         return self._create_section("considerations", paragraphs)
 
@@ -171,42 +271,38 @@ class NondisclosureService:
         ------
             Exception: If there is an error loading any clause.
         """
-        agreements_path = self.variant_path / "agreements"
-        clauses_path = agreements_path / "clauses"
+        agreements_path = os.path.join(self.variant_path, "agreements")
+        clauses_path = os.path.join(agreements_path, "clauses")
+        self.template_service.preload_dir(clauses_path)
 
-        clauses: list[Clause] = []
-        for clause in self.standard_clauses:
-            logger.debug(f"Loading clause: {clause}")
-            try:
-                clause_data = self.template_service.load(clauses_path / f"{clause}.json")
-                clauses.append(Clause(**clause_data))
+        get_clause = self.template_service.get_clause
+        try:
+            clauses: list[Clause] = [
+                get_clause(os.path.join(clauses_path, filename))
+                for filename in _VARIANT_CLAUSE_FILES[self.request.contract_variant]
+            ]
 
-            except Exception as err:
-                logger.error(f"Error loading clause {clause}: {err!s}")
-                raise
+        except Exception as err:
+            logger.error(f"Error loading clauses from {clauses_path}: {err!s}")
+            raise
 
         term_type = "limited" if self.request.limited_term else "unlimited"
         logger.debug(f"Loading term clause: {term_type}")
-        term_clause = Clause(
-            **self.template_service.load(agreements_path / "term" / f"{term_type}.json")
-        )
+        term_clause = get_clause(os.path.join(agreements_path, "term", f"{term_type}.json"))
 
         if self.request.penalty_clause:
             logger.debug("Loading enforcement_and_penalties.json")
-            enforcement_clause = Clause(
-                **self.template_service.load(clauses_path / "enforcement_and_penalties.json")
+            enforcement_clause = get_clause(
+                os.path.join(clauses_path, "enforcement_and_penalties.json")
             )
         else:
             logger.debug("Loading enforcement_and_remedies.json")
-            enforcement_clause = Clause(
-                **self.template_service.load(clauses_path / "enforcement_and_remedies.json")
+            enforcement_clause = get_clause(
+                os.path.join(clauses_path, "enforcement_and_remedies.json")
             )
 
-        no_warranty_index = next(
-            i for i, clause in enumerate(clauses) if clause.title.lower().startswith("no warranty")
-        )
-        clauses.insert(no_warranty_index, enforcement_clause)
-        clauses.insert(no_warranty_index, term_clause)
+        no_warranty_index = self._NO_WARRANTY_INDEX
+        clauses[no_warranty_index:no_warranty_index] = [term_clause, enforcement_clause]
 
         typed_clauses: list[BaseText | Paragraph | Clause] = list(clauses)
         return self._create_section("agreements", typed_clauses)
@@ -215,13 +311,14 @@ class NondisclosureService:
         """Generate the signatures section of the NDA.
 
         This method creates a section containing signature blocks for all parties
-        to sign the NDA.
+        to sign the NDA. The section carries no request-specific state, so the
+        cached validated instance is returned as-is.
 
         Returns
         -------
             Section: The generated signatures section.
         """
-        return self._create_section("signatures", [])
+        return _validated_section(os.path.join(self.general_path, "sections", "signatures.json"))
 
     def generate(self) -> Contract:
         """Generate a complete NDA from the request.
@@ -241,9 +338,15 @@ class NondisclosureService:
             err_msg = "Context or party context is missing"
             raise ValueError(err_msg)
 
-        return Contract(
-            parties=self._generate_parties().render(self.party_context),
-            considerations=self._generate_considerations().render(self.context),
-            agreements=self._generate_agreements().render(self.context),
-            signatures=self._generate_signatures().render(self.context),
+        submit = _SECTION_EXECUTOR.submit
+        parties_future: Future[Section] = submit(self._generate_parties)
+        considerations_future: Future[Section] = submit(self._generate_considerations)
+        agreements_future: Future[Section] = submit(self._generate_agreements)
+        signatures_future: Future[Section] = submit(self._generate_signatures)
+
+        return Contract.model_construct(
+            parties=parties_future.result().render(self.party_context),
+            considerations=considerations_future.result().render(self.context),
+            agreements=agreements_future.result().render(self.context),
+            signatures=signatures_future.result().render(self.context),
         )
@@ -4,14 +4,96 @@ This module provides services for loading and processing contract templates from
 JSON files. It includes error handling and logging for template loading operations.
 """
 
-import json
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+import functools
 from json import JSONDecodeError
+import os
 from pathlib import Path
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any
 
 from loguru import logger
+import orjson
 
-from pactdesk.models.domain.base import BaseText
+from pactdesk.models.domain.base import BaseText, Clause
+
+
+_PRELOAD_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pactdesk-preload")
+_preloaded_dirs: set[str] = set()
+_dependent_cache_clears: list[Callable[[], None]] = []
+
+
+def register_dependent_cache(clear: Callable[[], None]) -> None:
+    """Register the clear function of a cache derived from template data.
+
+    Other modules that cache objects built from template files register
+    their clear functions here, so TemplateService.clear_cache invalidates
+    the whole stack in one call.
+
+    Args:
+        clear (Callable[[], None]): The dependent cache's clear function.
+    """
+    _dependent_cache_clears.append(clear)
+
+
+@functools.lru_cache(maxsize=512)
+def _load_cached(path_str: str) -> dict[str, Any]:
+    """Read and parse a template JSON file, memoized per path.
+
+    Template files are immutable for the lifetime of the process, so each
+    file is read from disk and parsed at most once; subsequent loads are
+    served from the in-process cache.
+
+    Args:
+        path_str (str): The path to the template file.
+
+    Returns
+    -------
+        dict[str, Any]: The parsed template data.
+
+    Raises
+    ------
+        FileNotFoundError: If the template file does not exist.
+        JSONDecodeError: If the template file contains invalid JSON.
+        Exception: For any other error during template loading.
+    """
+    try:
+        content = Path(path_str).read_bytes()
+        if not content:
+            logger.error(f"Empty file at path: {path_str}")
+            return {}
+
+        return orjson.loads(content)  # type: ignore[no-any-return]
+
+    except FileNotFoundError:
+        logger.error(f"Template file not found: {path_str}")
+        raise
+
+    except JSONDecodeError as err:
+        logger.error(f"JSON decode error in file {path_str}: {err!s}")
+        raise
+
+    except Exception as err:
+        logger.error(f"Error loading template from {path_str}: {err!s}")
+        raise
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_clause(path_str: str) -> Clause:
+    """Parse and validate a clause template, memoized per path.
+
+    The validated Clause is shared across requests; rendering reads the
+    instance without mutating it, so sharing is safe.
+
+    Args:
+        path_str (str): The path to the clause template file.
+
+    Returns
+    -------
+        Clause: The validated clause model.
+    """
+    return Clause(**_load_cached(path_str))
 
 
 class TemplateService:
@@ -32,16 +114,24 @@ class TemplateService:
             base_path (Path): The base directory for template files.
         """
         self.base_path = base_path
+        self._legal_entity_cache: BaseText | None = None
+        self._natural_person_cache: BaseText | None = None
 
-    def load(self, path: Path) -> dict[str, Any]:
+    def load(self, path: Path | str) -> Mapping[str, Any]:
         """Load a template from a JSON file.
 
+        Parsed templates are cached per path for the lifetime of the
+        process; callers receive a read-only view of the cached data, so
+        warm loads no longer pay for a deep copy. The view is shallow:
+        treat nested structures as immutable too. Hot call sites may pass
+        a pre-joined string to skip Path construction.
+
         Args:
-            path (Path): The path to the template file.
+            path (Path | str): The path to the template file.
 
         Returns
         -------
-            dict[str, Any]: The loaded template data.
+            Mapping[str, Any]: A read-only view of the template data.
 
         Raises
         ------
@@ -49,45 +139,88 @@ class TemplateService:
             JSONDecodeError: If the template file contains invalid JSON.
             Exception: For any other error during template loading.
         """
-        logger.debug(f"Loading template from path: {path}")
-        try:
-            with Path.open(path) as f:
-                content = f.read()
-                logger.debug(f"File content length: {len(content)}")
-                if not content:
-                    logger.error(f"Empty file at path: {path}")
-                    return {}
+        return MappingProxyType(_load_cached(os.fspath(path)))
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the in-process template cache.
+
+        Intended for tests and tooling that rewrite template files within a
+        process's lifetime; production code never needs it.
+        """
+        _cached_clause.cache_clear()
+        _load_cached.cache_clear()
+        _preloaded_dirs.clear()
+        for clear in _dependent_cache_clears:
+            clear()
+
+    def preload_dir(self, directory: Path | str) -> None:
+        """Warm the template cache for every JSON file in a directory.
+
+        Cold loads are issued concurrently so their filesystem latency
+        overlaps; each directory is only scanned once per process, making
+        subsequent calls effectively free.
+
+        Args:
+            directory (Path | str): The directory containing template files.
+        """
+        dir_key = os.fspath(directory)
+        if dir_key in _preloaded_dirs:
+            return
 
-                return cast(dict[str, Any], json.loads(content))
+        with os.scandir(dir_key) as entries:
+            paths = [entry.path for entry in entries if entry.name.endswith(".json")]
+        for _ in _PRELOAD_EXECUTOR.map(_load_cached, paths):
+            pass
 
-        except FileNotFoundError:
-            logger.error(f"Template file not found: {path}")
-            raise
+        _preloaded_dirs.add(dir_key)
 
-        except JSONDecodeError as err:
-            logger.error(f"JSON decode error in file {path}: {err!s}")
-            raise
+    def get_clause(self, path: Path | str) -> Clause:
+        """Return the validated Clause model for a template path.
 
-        except Exception as err:
-            logger.error(f"Error loading template from {path}: {err!s}")
-            raise
+        Clause models are cached per path and shared across requests,
+        skipping both the JSON parse and the pydantic validation on warm
+        loads.
+
+        Args:
+            path (Path | str): The path to the clause template file.
+
+        Returns
+        -------
+            Clause: The validated clause model.
+        """
+        return _cached_clause(os.fspath(path))
 
     def load_legal_entity(self) -> BaseText:
         """Load the template for a legal entity party.
 
+        The validated model is cached on the instance after the first call,
+        so repeat calls skip the path join and cache lookup entirely.
+        Rendering does not mutate the model, so sharing it is safe.
+
         Returns
         -------
             BaseText: The loaded legal entity template.
         """
-        template = self.load(self.base_path / "general" / "parties" / "legal_entity.json")
-        return BaseText(**template)
+        if self._legal_entity_cache is None:
+            template = self.load(self.base_path / "general" / "parties" / "legal_entity.json")
+            self._legal_entity_cache = BaseText(**template)
+
+        return self._legal_entity_cache
 
     def load_natural_person(self) -> BaseText:
         """Load the template for a natural person party.
 
+        The validated model is cached on the instance after the first call,
+        so repeat calls skip the path join and cache lookup entirely.
+        Rendering does not mutate the model, so sharing it is safe.
+
         Returns
         -------
             BaseText: The loaded natural person template.
         """
-        template = self.load(self.base_path / "general" / "parties" / "natural_person.json")
-        return BaseText(**template)
+        if self._natural_person_cache is None:
+            template = self.load(self.base_path / "general" / "parties" / "natural_person.json")
+            self._natural_person_cache = BaseText(**template)
+
+        return self._natural_person_cache